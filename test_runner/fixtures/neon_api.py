@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 import time
 from typing import TYPE_CHECKING, cast
 
@@ -24,6 +25,16 @@ class NeonAPI:
     def __init__(self, neon_api_key: str, neon_api_base_url: str):
         self.__neon_api_key = neon_api_key
         self.__neon_api_base_url = neon_api_base_url.strip("/")
+        # Keep connections to the API alive between requests. requests.Session isn't
+        # thread-safe, and tests call the API from several threads, so use one per thread.
+        self.__thread_local = threading.local()
+
+    def __session(self) -> requests.Session:
+        session: Optional[requests.Session] = getattr(self.__thread_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self.__thread_local.session = session
+        return session
 
     def __request(
         self, method: Union[str, bytes], endpoint: str, **kwargs: Any
@@ -32,7 +43,7 @@ class NeonAPI:
             kwargs["headers"] = {}
         kwargs["headers"]["Authorization"] = f"Bearer {self.__neon_api_key}"
 
-        return requests.request(method, f"{self.__neon_api_base_url}{endpoint}", **kwargs)
+        return self.__session().request(method, f"{self.__neon_api_base_url}{endpoint}", **kwargs)
 
     def create_project(
         self,
@@ -2908,6 +2908,7 @@ class PgBin:
         command: List[str],
         env: Optional[Env] = None,
         cwd: Optional[Union[str, Path]] = None,
+        **popen_kwargs: Any,
     ) -> subprocess.Popen[Any]:
         """
         Run one of the postgres binaries, not waiting for it to finish
@@ -2919,13 +2920,15 @@ class PgBin:
         If the first argument (the command name) doesn't include a path (no '/'
         characters present), then it will be edited to include the correct path.
 
+        stdout is piped by default; pass e.g. `stdout=subprocess.DEVNULL` to discard it.
         If you want stdout/stderr captured to files, use `run_capture` instead.
         """
         self._fixpath(command)
         log.info(f"Running command '{' '.join(command)}'")
         env = self._build_env(env)
         self._log_env(env)
-        return subprocess.Popen(command, env=env, cwd=cwd, stdout=subprocess.PIPE, text=True)
+        popen_kwargs.setdefault("stdout", subprocess.PIPE)
+        return subprocess.Popen(command, env=env, cwd=cwd, text=True, **popen_kwargs)
 
     def run(
         self,
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import concurrent.futures
+import statistics
+import subprocess
 import time
 import traceback
 from typing import TYPE_CHECKING
@@ -15,6 +18,8 @@ from fixtures.neon_fixtures import AuxFileStore, logical_replication_sync
 from fixtures.pg_version import PgVersion
 
 if TYPE_CHECKING:
+    from typing import Any, Dict, Literal, Tuple
+
     from fixtures.benchmark_fixture import NeonBenchmarker
     from fixtures.neon_api import NeonAPI
     from fixtures.neon_fixtures import NeonEnv, PgBin
@@ -36,10 +41,8 @@ def test_logical_replication(neon_simple_env: NeonEnv, pg_bin: PgBin, vanilla_pg
 
     # now start subscriber
     vanilla_pg.start()
-    pg_bin.run_capture(["pgbench", "-i", "-s10", vanilla_pg.connstr()])
-
-    vanilla_pg.safe_psql("truncate table pgbench_accounts")
-    vanilla_pg.safe_psql("truncate table pgbench_history")
+    # Only create the schema, the data arrives through the subscription's initial sync
+    pg_bin.run_capture(["pgbench", "-i", "-I", "dtp", "-s10", vanilla_pg.connstr()])
 
     connstr = endpoint.connstr().replace("'", "''")
     vanilla_pg.safe_psql(f"create subscription sub1 connection '{connstr}' publication pub1")
@@ -50,12 +53,16 @@ def test_logical_replication(neon_simple_env: NeonEnv, pg_bin: PgBin, vanilla_pg
     pg_bin.run_capture(["pgbench", "-c10", "-T100", "-Mprepared", endpoint.connstr()])
 
     # Wait logical replication to sync
-    start = time.time()
+    start = time.monotonic()
     logical_replication_sync(vanilla_pg, endpoint)
-    log.info(f"Sync with master took {time.time() - start} seconds")
-
-    sum_master = endpoint.safe_psql("select sum(abalance) from pgbench_accounts")[0][0]
-    sum_replica = vanilla_pg.safe_psql("select sum(abalance) from pgbench_accounts")[0][0]
+    log.info(f"Sync with master took {time.monotonic() - start} seconds")
+
+    # The two servers are independent, so run the checksum queries in parallel
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        sum_master, sum_replica = executor.map(
+            lambda pg: pg.safe_psql("select sum(abalance) from pgbench_accounts")[0][0],
+            [endpoint, vanilla_pg],
+        )
     assert sum_master == sum_replica
 
 
@@ -65,278 +72,299 @@ def check_pgbench_still_running(pgbench, label=""):
         raise RuntimeError(f"{label} pgbench terminated early with return code {rc}")
 
 
-def measure_logical_replication_lag(sub_cur, pub_cur, timeout_sec=600):
-    start = time.time()
+def connect_autocommit(connstr: str):
+    conn = psycopg2.connect(connstr)
+    conn.autocommit = True
+    return conn
+
+
+def connect_subscriber(connstr: str):
+    """
+    Connects to the subscriber, and prepares the LSN probe that
+    `measure_logical_replication_lag` sends on every polling iteration.
+    """
+    conn = connect_autocommit(connstr)
+    with conn.cursor() as cur:
+        cur.execute(
+            "PREPARE lag_sub AS SELECT latest_end_lsn FROM pg_catalog.pg_stat_subscription "
+            "WHERE subname = 'sub1'"
+        )
+    return conn
+
+
+def measure_logical_replication_lag(
+    sub_cur, pub_cur, timeout_sec=600, min_poll_interval=0.05, max_poll_interval=0.5
+) -> float:
+    """
+    Returns the time it takes the subscriber to catch up with the publisher's current
+    flush LSN.
+
+    The publisher LSN is read only once, so each polling iteration is a single round-trip
+    to the subscriber. The two probes go to different servers and the second depends on
+    the first, so there is nothing to gain from pipelining them.
+
+    `sub_cur` must belong to a connection opened with `connect_subscriber`.
+    """
+    start = time.monotonic()
     pub_cur.execute("SELECT pg_current_wal_flush_lsn()")
-    pub_lsn = Lsn(pub_cur.fetchall()[0][0])
-    while (time.time() - start) < timeout_sec:
-        sub_cur.execute("SELECT latest_end_lsn FROM pg_catalog.pg_stat_subscription")
-        res = sub_cur.fetchall()[0][0]
+    pub_lsn = Lsn(pub_cur.fetchone()[0])
+    # Poll with exponential backoff while the subscriber is stalled, and reset to the
+    # minimum interval whenever it makes progress, so catching up is noticed quickly.
+    poll_interval = min_poll_interval
+    last_sub_lsn = None
+    while (time.monotonic() - start) < timeout_sec:
+        sub_cur.execute("EXECUTE lag_sub")
+        res = sub_cur.fetchone()[0]
         if res:
-            log.info(f"subscriber_lsn={res}")
             sub_lsn = Lsn(res)
             log.info(f"Subscriber LSN={sub_lsn}, publisher LSN={pub_lsn}")
             if sub_lsn >= pub_lsn:
-                return time.time() - start
-        time.sleep(0.5)
+                return time.monotonic() - start
+            if last_sub_lsn is None or sub_lsn > last_sub_lsn:
+                # Subscriber is making progress, check back soon
+                poll_interval = min_poll_interval
+            last_sub_lsn = sub_lsn
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, max_poll_interval)
     raise TimeoutError(f"Logical replication sync took more than {timeout_sec} sec")
 
 
-@pytest.mark.remote_cluster
-@pytest.mark.timeout(2 * 60 * 60)
-def test_subscriber_lag(
+def create_pub_sub_projects(
+    neon_api: NeonAPI, pg_version: PgVersion
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Creates the publisher and subscriber projects concurrently, and waits for both to
+    become ready. If anything fails, the projects that were created are deleted.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        create_futures = [executor.submit(neon_api.create_project, pg_version) for _ in range(2)]
+        concurrent.futures.wait(create_futures)
+        projects = [f.result() for f in create_futures if f.exception() is None]
+        try:
+            # Re-raise the creation error, if any
+            for f in create_futures:
+                f.result()
+            wait_futures = [
+                executor.submit(neon_api.wait_for_operation_to_finish, p["project"]["id"])
+                for p in projects
+            ]
+            # Let all waits finish before deleting anything they may still be polling
+            concurrent.futures.wait(wait_futures)
+            for f in wait_futures:
+                f.result()
+        except Exception:
+            for project in projects:
+                project_id = project["project"]["id"]
+                try:
+                    neon_api.delete_project(project_id)
+                except Exception as e:
+                    log.error(f"Failed to delete project {project_id}: {e}")
+            raise
+    pub_project, sub_project = projects
+    return pub_project, sub_project
+
+
+def run_restart_test(
+    restart_side: Literal["pub", "sub"],
     pg_bin: PgBin,
     neon_api: NeonAPI,
     pg_version: PgVersion,
     zenbenchmark: NeonBenchmarker,
+    test_duration_min: int = 60,
+    sync_interval_min: int = 5,
+    lag_sample_interval_sec: int = 10,
 ):
     """
     Creates a publisher and subscriber, runs pgbench inserts on publisher and pgbench selects
-    on subscriber. Periodically restarts subscriber while still running the inserts, and
-    measures how long sync takes after restart.
-    """
-    test_duration_min = 60
-    sync_interval_min = 5
-    pgbench_duration = f"-T{test_duration_min * 60 * 2}"
+    on subscriber. Every `sync_interval_min` minutes, restarts the endpoint on
+    `restart_side` while the workloads keep running, and records the replication lag.
 
-    pub_project = neon_api.create_project(pg_version)
-    pub_project_id = pub_project["project"]["id"]
-    neon_api.wait_for_operation_to_finish(pub_project_id)
+    When the subscriber is restarted, the lag is sampled throughout each interval and the
+    median is reported. When the publisher is restarted, the lag is measured right after
+    the restart, i.e. it is the time the subscriber takes to catch up.
+    """
+    pgbench_duration = test_duration_min * 60 * 2
+    pgbench_scale = 100
+    pgbench_args = {
+        "pub": ["-Mprepared"],
+        "sub": ["-S", "-Mprepared"],
+    }
+
+    pub_project, sub_project = create_pub_sub_projects(neon_api, pg_version)
+    projects = {"pub": pub_project, "sub": sub_project}
+    project_ids = {side: project["project"]["id"] for side, project in projects.items()}
     error_occurred = False
     try:
-        sub_project = neon_api.create_project(pg_version)
-        sub_project_id = sub_project["project"]["id"]
-        sub_endpoint_id = sub_project["endpoints"][0]["id"]
-        neon_api.wait_for_operation_to_finish(sub_project_id)
-        try:
-            pub_env = connection_parameters_to_env(
-                pub_project["connection_uris"][0]["connection_parameters"]
+        envs = {
+            side: connection_parameters_to_env(
+                project["connection_uris"][0]["connection_parameters"]
             )
-            sub_env = connection_parameters_to_env(
-                sub_project["connection_uris"][0]["connection_parameters"]
+            for side, project in projects.items()
+        }
+        pub_connstr = pub_project["connection_uris"][0]["connection_uri"]
+        sub_connstr = sub_project["connection_uris"][0]["connection_uri"]
+
+        # Publisher and subscriber are independent projects, initialize them in parallel
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            init_futures = [
+                executor.submit(
+                    pg_bin.run_capture,
+                    ["pgbench", "-i", f"-s{pgbench_scale}", "--no-vacuum"],
+                    env=envs["pub"],
+                ),
+                # Only create the schema on the subscriber: the data arrives through
+                # the subscription's initial table sync.
+                executor.submit(
+                    pg_bin.run_capture,
+                    ["pgbench", "-i", "-I", "dtp", f"-s{pgbench_scale}"],
+                    env=envs["sub"],
+                ),
+            ]
+            for future in concurrent.futures.as_completed(init_futures):
+                future.result()
+
+        # The same connections are reused for all lag measurements, and only
+        # re-established after an endpoint restart breaks them.
+        pub_conn = connect_autocommit(pub_connstr)
+        sub_conn = connect_subscriber(sub_connstr)
+        with pub_conn.cursor() as pub_cur, sub_conn.cursor() as sub_cur:
+            # The select-only workload on the subscriber derives the scale from the row count
+            # of pgbench_branches, which isn't replicated, so populate it here. With an empty
+            # table, the scale would be 0 and every pgbench client would abort.
+            sub_cur.execute(
+                "insert into pgbench_branches(bid, bbalance) "
+                f"select g, 0 from generate_series(1, {pgbench_scale}) g"
             )
-            pub_connstr = pub_project["connection_uris"][0]["connection_uri"]
-            sub_connstr = sub_project["connection_uris"][0]["connection_uri"]
-
-            pg_bin.run_capture(["pgbench", "-i", "-s100"], env=pub_env)
-            pg_bin.run_capture(["pgbench", "-i", "-s100"], env=sub_env)
-
-            pub_conn = psycopg2.connect(pub_connstr)
-            sub_conn = psycopg2.connect(sub_connstr)
-            pub_conn.autocommit = True
-            sub_conn.autocommit = True
-            with pub_conn.cursor() as pub_cur, sub_conn.cursor() as sub_cur:
-                sub_cur.execute("truncate table pgbench_accounts")
-                sub_cur.execute("truncate table pgbench_history")
-
-                pub_cur.execute(
-                    "create publication pub1 for table pgbench_accounts, pgbench_history"
-                )
-                sub_cur.execute(
-                    f"create subscription sub1 connection '{pub_connstr}' publication pub1"
-                )
-
-                initial_sync_lag = measure_logical_replication_lag(sub_cur, pub_cur)
-            pub_conn.close()
-            sub_conn.close()
+            pub_cur.execute("create publication pub1 for table pgbench_accounts, pgbench_history")
+            sub_cur.execute(f"create subscription sub1 connection '{pub_connstr}' publication pub1")
+
+            initial_sync_lag = measure_logical_replication_lag(sub_cur, pub_cur)
 
-            zenbenchmark.record(
-                "initial_sync_lag", initial_sync_lag, "s", MetricReport.LOWER_IS_BETTER
+        zenbenchmark.record("initial_sync_lag", initial_sync_lag, "s", MetricReport.LOWER_IS_BETTER)
+
+        def measure_lag() -> float:
+            nonlocal pub_conn, sub_conn
+            try:
+                with pub_conn.cursor() as pub_cur, sub_conn.cursor() as sub_cur:
+                    return measure_logical_replication_lag(sub_cur, pub_cur)
+            except psycopg2.OperationalError:
+                log.info("Lost connection after endpoint restart, reconnecting")
+                pub_conn.close()
+                sub_conn.close()
+                pub_conn = connect_autocommit(pub_connstr)
+                sub_conn = connect_subscriber(sub_connstr)
+                with pub_conn.cursor() as pub_cur, sub_conn.cursor() as sub_cur:
+                    return measure_logical_replication_lag(sub_cur, pub_cur)
+
+        def start_workload(side: str, duration_sec: int) -> subprocess.Popen[Any]:
+            return pg_bin.run_nonblocking(
+                ["pgbench", "-c10", f"-T{duration_sec}", *pgbench_args[side]],
+                env=envs[side],
+                stdout=subprocess.DEVNULL,
             )
 
-            pub_workload = pg_bin.run_nonblocking(
-                ["pgbench", "-c10", pgbench_duration, "-Mprepared"], env=pub_env
+        def check_workloads_still_running():
+            for side, workload in workloads.items():
+                check_pgbench_still_running(workload, side)
+
+        def restart_endpoint():
+            workloads[restart_side].terminate()
+            neon_api.restart_endpoint(
+                project_ids[restart_side],
+                projects[restart_side]["endpoints"][0]["id"],
             )
-            try:
-                sub_workload = pg_bin.run_nonblocking(
-                    ["pgbench", "-c10", pgbench_duration, "-S"],
-                    env=sub_env,
-                )
-                try:
-                    start = time.time()
-                    while time.time() - start < test_duration_min * 60:
-                        time.sleep(sync_interval_min * 60)
-                        check_pgbench_still_running(pub_workload, "pub")
-                        check_pgbench_still_running(sub_workload, "sub")
-
-                        with psycopg2.connect(pub_connstr) as pub_conn, psycopg2.connect(
-                            sub_connstr
-                        ) as sub_conn:
-                            with pub_conn.cursor() as pub_cur, sub_conn.cursor() as sub_cur:
-                                lag = measure_logical_replication_lag(sub_cur, pub_cur)
-
-                        log.info(f"Replica lagged behind master by {lag} seconds")
-                        zenbenchmark.record("replica_lag", lag, "s", MetricReport.LOWER_IS_BETTER)
-                        sub_workload.terminate()
-                        neon_api.restart_endpoint(
-                            sub_project_id,
-                            sub_endpoint_id,
-                        )
-                        neon_api.wait_for_operation_to_finish(sub_project_id)
-                        sub_workload = pg_bin.run_nonblocking(
-                            ["pgbench", "-c10", pgbench_duration, "-S"],
-                            env=sub_env,
-                        )
-
-                        # Measure storage to make sure replication information isn't bloating storage
-                        sub_storage = neon_api.get_project_details(sub_project_id)["project"][
-                            "synthetic_storage_size"
-                        ]
-                        pub_storage = neon_api.get_project_details(pub_project_id)["project"][
-                            "synthetic_storage_size"
-                        ]
-                        zenbenchmark.record(
-                            "sub_storage", sub_storage, "B", MetricReport.LOWER_IS_BETTER
-                        )
-                        zenbenchmark.record(
-                            "pub_storage", pub_storage, "B", MetricReport.LOWER_IS_BETTER
-                        )
-
-                finally:
-                    sub_workload.terminate()
-            finally:
-                pub_workload.terminate()
-        except Exception as e:
-            error_occurred = True
-            log.error(f"Caught exception {e}")
-            log.error(traceback.format_exc())
+            neon_api.wait_for_operation_to_finish(project_ids[restart_side])
+            # Only run the relaunched workload for the rest of the test, plus
+            # enough margin for it to outlive the last check in the loop. Slow lag
+            # measurements can overrun the test duration, so never go below the margin.
+            margin = sync_interval_min * 60 + 60
+            remaining_duration = max(
+                int(test_duration_min * 60 - (time.monotonic() - start)) + margin, margin
+            )
+            workloads[restart_side] = start_workload(restart_side, remaining_duration)
+
+        workloads: Dict[str, subprocess.Popen[Any]] = {}
+        try:
+            workloads["pub"] = start_workload("pub", pgbench_duration)
+            workloads["sub"] = start_workload("sub", pgbench_duration)
+
+            start = time.monotonic()
+            while time.monotonic() - start < test_duration_min * 60:
+                if restart_side == "sub":
+                    # Sample the lag throughout the interval and report the median, so
+                    # that a single measurement during a burst of WAL doesn't skew it
+                    lag_samples = []
+                    interval_start = time.monotonic()
+                    while time.monotonic() - interval_start < sync_interval_min * 60:
+                        time.sleep(lag_sample_interval_sec)
+                        check_workloads_still_running()
+                        lag_samples.append(measure_lag())
+                    lag = statistics.median(lag_samples)
+                    log.info(
+                        f"Replica lagged behind master by {lag} seconds "
+                        f"(median of {len(lag_samples)} samples)"
+                    )
+                    restart_endpoint()
+                else:
+                    time.sleep(sync_interval_min * 60)
+                    check_workloads_still_running()
+                    restart_endpoint()
+                    lag = measure_lag()
+                    log.info(f"Replica lagged behind master by {lag} seconds")
+
+                zenbenchmark.record("replica_lag", lag, "s", MetricReport.LOWER_IS_BETTER)
+
+                # Measure storage to make sure replication information isn't bloating storage
+                with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                    sub_details, pub_details = executor.map(
+                        neon_api.get_project_details,
+                        [project_ids["sub"], project_ids["pub"]],
+                    )
+                sub_storage = sub_details["project"]["synthetic_storage_size"]
+                pub_storage = pub_details["project"]["synthetic_storage_size"]
+                zenbenchmark.record("sub_storage", sub_storage, "B", MetricReport.LOWER_IS_BETTER)
+                zenbenchmark.record("pub_storage", pub_storage, "B", MetricReport.LOWER_IS_BETTER)
         finally:
-            if not error_occurred:
-                neon_api.delete_project(sub_project_id)
+            for workload in workloads.values():
+                workload.terminate()
+            pub_conn.close()
+            sub_conn.close()
     except Exception as e:
         error_occurred = True
         log.error(f"Caught exception {e}")
         log.error(traceback.format_exc())
     finally:
+        # Keep the projects around for investigation if the test failed
         assert not error_occurred
-        neon_api.delete_project(pub_project_id)
+        neon_api.delete_project(project_ids["sub"])
+        neon_api.delete_project(project_ids["pub"])
 
 
 @pytest.mark.remote_cluster
 @pytest.mark.timeout(2 * 60 * 60)
-def test_publisher_restart(
+def test_subscriber_lag(
     pg_bin: PgBin,
     neon_api: NeonAPI,
     pg_version: PgVersion,
     zenbenchmark: NeonBenchmarker,
 ):
     """
-    Creates a publisher and subscriber, runs pgbench inserts on publisher and pgbench selects
-    on subscriber. Periodically restarts publisher (to exercise on-demand WAL download), and
-    measures how long sync takes after restart.
+    Periodically restarts subscriber while running pgbench on both sides, and measures how
+    far the subscriber lags behind.
     """
-    test_duration_min = 60
-    sync_interval_min = 5
-    pgbench_duration = f"-T{test_duration_min * 60 * 2}"
-
-    pub_project = neon_api.create_project(pg_version)
-    pub_project_id = pub_project["project"]["id"]
-    pub_endpoint_id = pub_project["endpoints"][0]["id"]
-    neon_api.wait_for_operation_to_finish(pub_project_id)
-    error_occurred = False
-    try:
-        sub_project = neon_api.create_project(pg_version)
-        sub_project_id = sub_project["project"]["id"]
-        neon_api.wait_for_operation_to_finish(sub_project_id)
-        try:
-            pub_env = connection_parameters_to_env(
-                pub_project["connection_uris"][0]["connection_parameters"]
-            )
-            sub_env = connection_parameters_to_env(
-                sub_project["connection_uris"][0]["connection_parameters"]
-            )
-            pub_connstr = pub_project["connection_uris"][0]["connection_uri"]
-            sub_connstr = sub_project["connection_uris"][0]["connection_uri"]
-
-            pg_bin.run_capture(["pgbench", "-i", "-s100"], env=pub_env)
-            pg_bin.run_capture(["pgbench", "-i", "-s100"], env=sub_env)
-
-            pub_conn = psycopg2.connect(pub_connstr)
-            sub_conn = psycopg2.connect(sub_connstr)
-            pub_conn.autocommit = True
-            sub_conn.autocommit = True
-            with pub_conn.cursor() as pub_cur, sub_conn.cursor() as sub_cur:
-                sub_cur.execute("truncate table pgbench_accounts")
-                sub_cur.execute("truncate table pgbench_history")
-
-                pub_cur.execute(
-                    "create publication pub1 for table pgbench_accounts, pgbench_history"
-                )
-                sub_cur.execute(
-                    f"create subscription sub1 connection '{pub_connstr}' publication pub1"
-                )
-
-                initial_sync_lag = measure_logical_replication_lag(sub_cur, pub_cur)
-            pub_conn.close()
-            sub_conn.close()
+    run_restart_test("sub", pg_bin, neon_api, pg_version, zenbenchmark)
 
-            zenbenchmark.record(
-                "initial_sync_lag", initial_sync_lag, "s", MetricReport.LOWER_IS_BETTER
-            )
 
-            pub_workload = pg_bin.run_nonblocking(
-                ["pgbench", "-c10", pgbench_duration, "-Mprepared"], env=pub_env
-            )
-            try:
-                sub_workload = pg_bin.run_nonblocking(
-                    ["pgbench", "-c10", pgbench_duration, "-S"],
-                    env=sub_env,
-                )
-                try:
-                    start = time.time()
-                    while time.time() - start < test_duration_min * 60:
-                        time.sleep(sync_interval_min * 60)
-                        check_pgbench_still_running(pub_workload, "pub")
-                        check_pgbench_still_running(sub_workload, "sub")
-
-                        pub_workload.terminate()
-                        neon_api.restart_endpoint(
-                            pub_project_id,
-                            pub_endpoint_id,
-                        )
-                        neon_api.wait_for_operation_to_finish(pub_project_id)
-                        pub_workload = pg_bin.run_nonblocking(
-                            ["pgbench", "-c10", pgbench_duration, "-Mprepared"],
-                            env=pub_env,
-                        )
-                        with psycopg2.connect(pub_connstr) as pub_conn, psycopg2.connect(
-                            sub_connstr
-                        ) as sub_conn:
-                            with pub_conn.cursor() as pub_cur, sub_conn.cursor() as sub_cur:
-                                lag = measure_logical_replication_lag(sub_cur, pub_cur)
-
-                        log.info(f"Replica lagged behind master by {lag} seconds")
-                        zenbenchmark.record("replica_lag", lag, "s", MetricReport.LOWER_IS_BETTER)
-
-                        # Measure storage to make sure replication information isn't bloating storage
-                        sub_storage = neon_api.get_project_details(sub_project_id)["project"][
-                            "synthetic_storage_size"
-                        ]
-                        pub_storage = neon_api.get_project_details(pub_project_id)["project"][
-                            "synthetic_storage_size"
-                        ]
-                        zenbenchmark.record(
-                            "sub_storage", sub_storage, "B", MetricReport.LOWER_IS_BETTER
-                        )
-                        zenbenchmark.record(
-                            "pub_storage", pub_storage, "B", MetricReport.LOWER_IS_BETTER
-                        )
-
-                finally:
-                    sub_workload.terminate()
-            finally:
-                pub_workload.terminate()
-        except Exception as e:
-            error_occurred = True
-            log.error(f"Caught exception {e}")
-            log.error(traceback.format_exc())
-        finally:
-            if not error_occurred:
-                neon_api.delete_project(sub_project_id)
-    except Exception as e:
-        error_occurred = True
-        log.error(f"Caught exception {e}")
-        log.error(traceback.format_exc())
-    finally:
-        assert not error_occurred
-        neon_api.delete_project(pub_project_id)
+@pytest.mark.remote_cluster
+@pytest.mark.timeout(2 * 60 * 60)
+def test_publisher_restart(
+    pg_bin: PgBin,
+    neon_api: NeonAPI,
+    pg_version: PgVersion,
+    zenbenchmark: NeonBenchmarker,
+):
+    """
+    Periodically restarts publisher (to exercise on-demand WAL download) while running
+    pgbench on both sides, and measures how long sync takes after restart.
+    """
+    run_restart_test("pub", pg_bin, neon_api, pg_version, zenbenchmark)
@@ -1,6 +1,5 @@
-import time
-
 from fixtures.neon_fixtures import NeonEnv
+from fixtures.utils import query_scalar, wait_until
 
 
 def test_migrations(neon_simple_env: NeonEnv):
@@ -16,20 +15,16 @@ def test_migrations(neon_simple_env: NeonEnv):
     num_migrations = 10
 
     with endpoint.cursor() as cur:
-        cur.execute("SELECT id FROM neon_migration.migration_id")
-        migration_id = cur.fetchall()
-        assert migration_id[0][0] == num_migrations
+        assert query_scalar(cur, "SELECT id FROM neon_migration.migration_id") == num_migrations
 
     endpoint.assert_log_contains(f"INFO handle_migrations: Ran {num_migrations} migrations")
 
     endpoint.stop()
     endpoint.start()
-    # We don't have a good way of knowing that the migrations code path finished executing
-    # in compute_ctl in the case that no migrations are being run
-    time.sleep(1)
+    # When no migrations are run, the only sign that the migrations code path finished
+    # executing in compute_ctl is the log line
+    wait_until(
+        100, 0.1, lambda: endpoint.assert_log_contains("INFO handle_migrations: Ran 0 migrations")
+    )
     with endpoint.cursor() as cur:
-        cur.execute("SELECT id FROM neon_migration.migration_id")
-        migration_id = cur.fetchall()
-        assert migration_id[0][0] == num_migrations
-
-    endpoint.assert_log_contains("INFO handle_migrations: Ran 0 migrations")
+        assert query_scalar(cur, "SELECT id FROM neon_migration.migration_id") == num_migrations